@@ -49,7 +49,7 @@ def admin_panel():
 
 @app.route('/api/questions', methods=['GET'])
 def get_questions():
-    return jsonify(quiz_manager.get_all_questions())
+    return app.response_class(quiz_manager.get_all_questions_json(), mimetype='application/json')
 
 @app.route('/api/questions', methods=['POST'])
 def add_question():
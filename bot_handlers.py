@@ -15,9 +15,50 @@ from telegram.ext import (
     CallbackQueryHandler
 )
 from telegram.constants import ParseMode
+from telegram.error import BadRequest
 
 logger = logging.getLogger(__name__)
 
+# Plain-text stand-ins for the decorated characters in stats messages, used when Markdown is rejected
+_PLAIN_TEXT_TABLE = str.maketrans({
+    **{chr(0x1D5D4 + i): chr(ord('A') + i) for i in range(26)},  # Sans-serif bold capitals
+    **{chr(0x1D5EE + i): chr(ord('a') + i) for i in range(26)},  # Sans-serif bold small letters
+    '═': '=',
+    '•': '*'
+})
+
+# /stats message (TelegramQuizBot.globalstats), filled from get_global_statistics() with str.format_map
+_GLOBALSTATS_TEMPLATE = """📊 𝗕𝗼𝘁 𝗦𝘁𝗮𝘁𝗶𝘀𝘁𝗶𝗰𝘀
+════════════════
+
+👥 𝗨𝘀𝗲𝗿𝘀
+• Total Users: {users[total]:,}
+• Active Today: {users[active_today]:,}
+• Active This Week: {users[active_week]:,}
+• Active This Month: {users[active_month]:,}
+• New Users Today: {users[new_today]:,}
+
+📈 𝗣𝗲𝗿𝗳𝗼𝗿𝗺𝗮𝗻𝗰𝗲
+• Questions Available: {performance[questions_available]:,}
+• Total Quizzes Sent: {performance[total_quizzes]:,}
+• Correct Answers: {performance[correct_answers]:,}
+• Success Rate: {performance[success_rate]}%
+
+👥 𝗚𝗿𝗼𝘂𝗽𝘀
+• Total Groups: {groups[total]:,}
+• Active Groups: {groups[active]:,}
+• Inactive Groups: {groups[inactive]:,}
+
+🎯 𝗧𝗼𝗱𝗮𝘆'𝘀 𝗔𝗰𝘁𝗶𝘃𝗶𝘁𝘆
+• Quizzes Today: {today[quizzes]:,}
+• Users Today: {today[users]:,}
+• Success Rate: {today[success_rate]}%
+
+════════════════"""
+
+# Plain-text variant of the template, prepared once for when Markdown is rejected
+_GLOBALSTATS_PLAIN_TEMPLATE = _GLOBALSTATS_TEMPLATE.translate(_PLAIN_TEXT_TABLE)
+
 class TelegramQuizBot:
     def __init__(self, quiz_manager):
         """Initialize the quiz bot"""
@@ -31,6 +72,9 @@ class TelegramQuizBot:
         self.cache_timeout = 300  # 5 minutes cache timeout
         self.last_cache_update = datetime.now()
         self.start_time = datetime.now()
+        self._globalstats_cache = None  # (computed_at, stats_version, stats, message) of the last /stats reply
+        self._globalstats_ttl = 30  # seconds a /stats message is reused while the stats are unchanged
+        self._globalstats_markdown_ok = True  # Cleared once Telegram rejects the /stats Markdown
 
     async def _update_cache(self):
         """Update cache with fresh data"""
@@ -88,11 +132,7 @@ class TelegramQuizBot:
                 'timestamp': datetime.now().isoformat()
             }
 
-            # Record both global and group-specific score
-            if is_correct:
-                self.quiz_manager.increment_score(answer.user.id)
-
-            # Record group attempt
+            # Record group attempt (also updates the global score and stats)
             self.quiz_manager.record_group_attempt(
                 user_id=answer.user.id,
                 chat_id=chat_id,
@@ -201,7 +241,7 @@ class TelegramQuizBot:
             self.application.add_handler(CommandHandler("dev", self.dev))
             self.application.add_handler(CommandHandler("allreload", self.allreload))
             self.application.add_handler(CommandHandler("addquiz", self.addquiz))
-            self.application.add_handler(CommandHandler("stats", self.stats))
+            self.application.add_handler(CommandHandler("stats", self.globalstats))
             self.application.add_handler(CommandHandler("editquiz", self.editquiz))
             self.application.add_handler(CommandHandler("delquiz", self.delquiz))
             self.application.add_handler(CommandHandler("delquiz_confirm", self.delquiz_confirm))
@@ -741,38 +781,37 @@ Special commands for Admins and Developers only:
                 await self._handle_dev_command_unauthorized(update)
                 return
 
-            # Get global statistics
-            stats = self.quiz_manager.get_global_statistics()
-
-            # Format statistics message
-            stats_message = f"""📊 𝗕𝗼𝘁 𝗦𝘁𝗮𝘁𝗶𝘀𝘁𝗶𝗰𝘀
-════════════════
-
-👥 𝗨𝘀𝗲𝗿𝘀
-• Total Users: {stats['users']['total']:,}
-• Active Today: {stats['users']['active_today']:,}
-• Active This Week: {stats['users']['active_week']:,}
-• Active This Month: {stats['users']['active_month']:,}
-
-📈 𝗣𝗲𝗿𝗳𝗼𝗿𝗺𝗮𝗻𝗰𝗲
-• Questions Available: {stats['performance']['questions_available']:,}
-• Total Quizzes Sent: {stats['performance']['total_quizzes']:,}
-• Correct Answers: {stats['performance']['correct_answers']:,}
-• Success Rate: {stats['performance']['success_rate']}%
-
-👥 𝗚𝗿𝗼𝘂𝗽𝘀
-• Total Groups: {stats['groups']['total']:,}
-• Active Groups: {stats['groups']['active']:,}
-• Inactive Groups: {stats['groups']['inactive']:,}
-
-🎯 𝗧𝗼𝗱𝗮𝘆'𝘀 𝗔𝗰𝘁𝗶𝘃𝗶𝘁𝘆
-• Quizzes Today: {stats['today']['quizzes']:,}
-• Users Today: {stats['today']['users']:,}
-• Success Rate: {stats['today']['success_rate']}%
-
-════════════════"""
+            # Reuse the last message while the stats are unchanged and it is recent,
+            # and unconditionally for repeats within the command cooldown
+            now = datetime.now()
+            stats_version = self.quiz_manager.get_stats_version()
+            cached = self._globalstats_cache
+            on_cooldown = not await self.check_cooldown(update.effective_user.id, "globalstats")
+            if cached and (on_cooldown or (cached[1] == stats_version and
+                                           (now - cached[0]).total_seconds() < self._globalstats_ttl)):
+                stats, stats_message = cached[2], cached[3]
+            else:
+                # Get global statistics and fill the template for the current send mode from them
+                stats = self.quiz_manager.get_global_statistics()
+                template = _GLOBALSTATS_TEMPLATE if self._globalstats_markdown_ok else _GLOBALSTATS_PLAIN_TEMPLATE
+                stats_message = template.format_map(stats)
+                self._globalstats_cache = (now, stats_version, stats, stats_message)
 
-            await update.message.reply_text(stats_message, parse_mode=ParseMode.MARKDOWN)
+            # The template never changes, so once Markdown is rejected send plain text straight away
+            if self._globalstats_markdown_ok:
+                try:
+                    await update.message.reply_text(stats_message, parse_mode=ParseMode.MARKDOWN)
+                except BadRequest as e:
+                    # Only an entity parse failure says the template itself is rejected
+                    if "can't parse entities" not in str(e).lower():
+                        raise
+                    logger.error(f"Failed to send stats with markdown, using plain text from now on: {e}")
+                    self._globalstats_markdown_ok = False
+                    stats_message = _GLOBALSTATS_PLAIN_TEMPLATE.format_map(stats)
+                    self._globalstats_cache = self._globalstats_cache[:3] + (stats_message,)
+                    await update.message.reply_text(stats_message)
+            else:
+                await update.message.reply_text(stats_message)
             logger.info(f"Global stats shown to developer {update.effective_user.id}")
 
         except Exception as e:
@@ -1030,63 +1069,6 @@ Error: {str(e)}
             logger.error(f"Error in addquiz: {e}")
             await update.message.reply_text("❌ Error adding quiz.")
 
-    async def stats(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
-        """Show complete bot statistics with real-time monitoring - Developer only"""
-        try:
-            if not await self.is_developer(update.message.from_user.id):
-                await self._handle_dev_command_unauthorized(update)
-                return
-
-            # Get global statistics
-            stats = self.quiz_manager.get_global_statistics()
-
-            # Calculate real-time metrics
-            current_time = datetime.now()
-            today_start = current_time.replace(hour=0, minute=0, second=0, microsecond=0)
-            week_start = today_start - timedelta(days=today_start.weekday())
-            month_start = today_start.replace(day=1)
-
-            # Format statistics message with enhanced analytics
-            stats_message = f"""📊 𝗕𝗼𝘁 𝗔𝗻𝗮𝗹𝘆𝘁𝗶𝗰𝘀
-════════════════
-
-👥 𝗨𝘀𝗲𝗿 𝗔𝗻𝗮𝗹𝘆𝘁𝗶𝗰𝘀
-• Total Users: {stats['users']['total']:,}
-• Active Today: {stats['users']['active_today']:,}
-• Active This Week: {stats['users']['active_week']:,}
-• Active This Month: {stats['users']['active_month']:,}
-• New Users Today: {stats.get('users', {}).get('new_today', 0):,}
-• User Retention Rate: {stats.get('users', {}).get('retention_rate', 0)}%
-
-📈 𝗣𝗲𝗿𝗳𝗼𝗿𝗺𝗮𝗻𝗰𝗲 𝗠𝗲𝘁𝗿𝗶𝗰𝘀
-• Questions Available: {stats['performance']['questions_available']:,}
-• Total Quizzes Sent: {stats['performance']['total_quizzes']:,}
-• Correct Answers: {stats['performance']['correct_answers']:,}
-• Success Rate: {stats['performance']['success_rate']}%
-• Average Response Time: {stats.get('performance', {}).get('avg_response_time', 'N/A')}
-• Quiz Completion Rate: {stats.get('performance', {}).get('completion_rate', 0)}%
-
-👥 𝗚𝗿𝗼𝘂𝗽 𝗔𝗻𝗮𝗹𝘆𝘁𝗶𝗰𝘀
-• Total Groups: {stats['groups']['total']:,}
-• Active Groups: {stats['groups']['active']:,}
-• Inactive Groups: {stats['groups']['inactive']:,}
-• Group Activity Rate: {stats.get('groups', {}).get('activity_rate', 0)}%
-• Average Group Size: {stats.get('groups', {}).get('avg_size', 0):.1f}
-
-🎯 𝗧𝗼𝗱𝗮𝘆'𝘀 𝗔𝗰𝘁𝗶𝘃𝗶𝘁𝘆
-• Quizzes Today: {stats['today']['quizzes']:,}
-• Users Today: {stats['today']['users']:,}
-• Success Rate: {stats['today']['success_rate']}%
-
-════════════════"""
-
-            await update.message.reply_text(stats_message, parse_mode=ParseMode.MARKDOWN)
-            logger.info(f"Global stats shown to developer {update.effective_user.id}")
-
-        except Exception as e:
-            logger.error(f"Error in stats command: {e}")
-            await update.message.reply_text("❌ Error retrieving statistics. Please try again.")
-
     async def editquiz(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
         """Show and edit quiz questions - Developer only"""
         try:
@@ -1958,8 +1940,7 @@ Are you sure?
 
             if query.data == "clear_quizzes_confirm_yes":
                 # Clear all questions
-                self.quiz_manager.questions = []
-                self.quiz_manager.save_data(force=True)
+                self.quiz_manager.clear_all_questions()
 
                 await query.edit_message_text(
                     """✅ 𝗤𝘂𝗶𝘇 𝗗𝗮𝘁𝗮 𝗖𝗹𝗲𝗮𝗿𝗲𝗱
@@ -2150,7 +2131,7 @@ No changes were made.
             self.application.add_handler(CommandHandler("dev", self.dev))
             self.application.add_handler(CommandHandler("allreload", self.allreload))
             self.application.add_handler(CommandHandler("addquiz", self.addquiz))
-            self.application.add_handler(CommandHandler("stats", self.stats))
+            self.application.add_handler(CommandHandler("stats", self.globalstats))
             self.application.add_handler(CommandHandler("editquiz", self.editquiz))
             self.application.add_handler(CommandHandler("delquiz", self.delquiz))
             self.application.add_handler(CommandHandler("delquiz_confirm", self.delquiz_confirm))
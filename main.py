@@ -3,12 +3,12 @@ import sys
 import logging
 import asyncio
 import signal
+import resource
 import threading
 import traceback
 from datetime import datetime, timedelta
 from keep_alive import keep_alive_app, start_keep_alive
 from app import app, init_bot
-import psutil  # Added this import
 
 # Configure logging
 logging.basicConfig(
@@ -31,25 +31,31 @@ async def health_check():
     """Perform regular health checks"""
     while True:
         try:
-            # Check memory usage
-            process = psutil.Process(os.getpid())
-            memory_usage = process.memory_info().rss / 1024 / 1024  # MB
+            # Check memory usage (peak RSS; KB on Linux, bytes on macOS)
+            max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+            memory_usage = max_rss / 1024 / 1024 if sys.platform == 'darwin' else max_rss / 1024  # MB
 
             if memory_usage > 500:  # 500MB threshold
                 logger.warning(f"High memory usage detected: {memory_usage}MB")
-                os.execv(sys.executable, ['python'] + sys.argv)
+                request_restart()
+                return
 
             # Check uptime and force restart if needed
             global last_restart
             if datetime.now() - last_restart > RESTART_INTERVAL:
                 logger.info("Performing scheduled restart")
-                os.execv(sys.executable, ['python'] + sys.argv)
+                request_restart()
+                return
 
             await asyncio.sleep(60)  # Check every minute
         except Exception as e:
             logger.error(f"Error in health check: {e}")
             await asyncio.sleep(30)  # Wait 30 seconds before retrying
 
+def request_restart():
+    """Terminate gracefully so pending data is saved and the supervisor restarts us"""
+    os.kill(os.getpid(), signal.SIGTERM)
+
 async def main():
     """Main async function to run both Flask and bot"""
     global error_count, last_restart
@@ -99,6 +105,7 @@ async def main():
 def signal_handler(signum, frame):
     """Handle termination signals"""
     logger.info(f"Received signal {signum}")
+    # Pending data is saved by QuizManager's atexit flush; saving here could deadlock on its save lock
     raise SystemExit("Received termination signal")
 
 def handle_exception(exc_type, exc_value, exc_traceback):
@@ -1,14 +1,111 @@
 import json
+import bisect
 import random
 import os
 import logging
+import time
+import atexit
+import tempfile
+import threading
 import traceback
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, NamedTuple
 from datetime import datetime, timedelta
-from collections import defaultdict, deque
+from collections import defaultdict, deque, OrderedDict
+
+try:
+    import orjson
+except ImportError:  # orjson is optional, fall back to the stdlib encoder
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
+_ONE_DAY = timedelta(days=1)
+_NO_ACTIVITY = {'attempts': 0, 'correct': 0}  # Shared read-only default for days without activity
+_EMPTY_DICT = {}  # Shared read-only default for missing sub-dicts
+_QUESTION_KEYS = frozenset(('question', 'options', 'correct_answer'))  # Required keys of submitted questions
+_DAILY_ACTIVITY_DAYS = 35  # Days of daily_activity kept per user/group; covers the monthly window
+
+
+def _dumps(data: Any, compact: bool = False) -> bytes:
+    """Serialize data to JSON bytes, indented unless compact is set"""
+    if orjson is not None:
+        # OPT_NON_STR_KEYS matches the stdlib's handling of int keys instead of raising
+        option = orjson.OPT_NON_STR_KEYS if compact else orjson.OPT_NON_STR_KEYS | orjson.OPT_INDENT_2
+        return orjson.dumps(data, option=option)
+    if compact:
+        return json.dumps(data, separators=(',', ':')).encode('utf-8')
+    return json.dumps(data, indent=2).encode('utf-8')
+
+
+def _trim_daily_activity(daily_activity: Dict, cutoff: str) -> None:
+    """Drop daily_activity entries dated before cutoff (YYYY-MM-DD)"""
+    for date in [date for date in daily_activity if date < cutoff]:
+        del daily_activity[date]
+
+
+def _is_valid_question(question: Any) -> bool:
+    """Check a stored question has its keys, four options and an in-range answer index"""
+    try:
+        options = question['options']
+        correct_answer = question['correct_answer']
+        question['question']
+    except (KeyError, TypeError, IndexError):
+        return False
+    # Exact type checks: loaded JSON only yields plain lists and ints, and a bool is not an answer index
+    return type(options) is list and len(options) == 4 and type(correct_answer) is int and 0 <= correct_answer < 4
+
+
+def _loads(raw: bytes) -> Any:
+    """Deserialize JSON bytes; raises json.JSONDecodeError on bad input"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+class _Calendar(NamedTuple):
+    """Dates for the current day as YYYY-MM-DD strings"""
+    today: str
+    yesterday: str
+    cutoff: str  # Oldest daily_activity date kept
+    week_start: str  # Monday of the current week
+    month_start: str  # First day of the current month
+    week_ago: str  # Start of the rolling 7-day window
+
+
+class _Ranking:
+    """Keep user ids ordered by a sort key so top-N lookups avoid a full sort"""
+
+    def __init__(self):
+        self._order = []  # Sorted (key, user_id) pairs, best first
+        self._keys = {}  # user_id -> its current key
+
+    def update(self, user_id: str, key: tuple) -> int:
+        """Insert user_id or move it to the position for its new key; returns the best position touched"""
+        old_key = self._keys.get(user_id)
+        if old_key == key:
+            return bisect.bisect_left(self._order, (key, user_id))
+        position = len(self._order)
+        if old_key is not None:
+            position = bisect.bisect_left(self._order, (old_key, user_id))
+            del self._order[position]
+        new_position = bisect.bisect_left(self._order, (key, user_id))
+        self._order.insert(new_position, (key, user_id))
+        self._keys[user_id] = key
+        return min(position, new_position)
+
+    def load(self, pairs) -> None:
+        """Replace the contents with (user_id, key) pairs, sorting once instead of inserting one by one"""
+        self._keys = dict(pairs)
+        self._order = sorted((key, user_id) for user_id, key in self._keys.items())
+
+    def top(self, count: int) -> List[str]:
+        """Return the user ids of the best count entries"""
+        return [user_id for _, user_id in self._order[:count]]
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+
 class QuizManager:
     def __init__(self):
         """Initialize the quiz manager with proper data structures and caching"""
@@ -17,32 +114,82 @@ class QuizManager:
         self.scores_file = "data/scores.json"
         self.active_chats_file = "data/active_chats.json"
         self.stats_file = "data/user_stats.json"
+        self.stats_journal_file = "data/user_stats.journal"
+        self.retired_journal_file = "data/user_stats.journal.old"  # Journal set aside while a compaction runs
+
+        # Map each persisted attribute to its file and whether it is written compactly
+        self._data_files = {
+            'questions': (self.questions_file, False),
+            'scores': (self.scores_file, True),
+            'active_chats': (self.active_chats_file, True),
+            'stats': (self.stats_file, True)
+        }
 
         # Initialize data attributes first
         self.questions = []
+        self._question_text_set = set()  # Normalized question texts for O(1) duplicate checks
         self.scores = {}
-        self.active_chats = []
+        self.active_chats = set()  # Chat ids; persisted as a sorted list
         self.stats = {}
 
         # Initialize caching structures
         self._cached_questions = None
         self._cached_leaderboard = None
-        self._leaderboard_cache_time = None
-        self._cache_duration = timedelta(minutes=5)
+        self._leaderboard_cache_date = None  # Day the cached leaderboard's "today" figures belong to
+        self._leaderboard_dirty = True  # Set whenever a ranked value changes
+        self._group_leaderboard_cache = {}  # chat_id -> (date, leaderboard), dropped when the group changes
+        self._user_stats_cache = OrderedDict()  # user_id -> (computed_at, formatted stats), LRU order
+        self._user_stats_ttl = timedelta(minutes=5)  # Mutators drop entries; the TTL only bounds staleness
+        self._user_stats_cache_size = 10000
+        self._global_stats_cache = None  # (computed_at, mutation_seq, statistics)
+        self._global_stats_ttl = timedelta(seconds=30)
+        self._mutation_seq = 0  # Bumped on every change flagged for saving
+        self._all_stats_updated = None  # (date, mutation_seq) left by the last update_all_stats run
+        self._calendar_dates = None  # Today's _Calendar, see _calendar()
+        self._calendar_expires = 0.0  # Epoch time of the next local midnight
 
         # Initialize tracking structures
-        self.recent_questions = defaultdict(lambda: deque(maxlen=50))  # Store last 50 questions per chat
-        self.last_question_time = defaultdict(dict)  # Track when each question was last asked in each chat
-        self.available_questions = defaultdict(list)  # Track available questions per chat
+        self.recent_questions = {}  # Store last 50 question indices per chat, see _recent()
+        self.last_question_time = {}  # Track when each recent question index was asked in each chat
+        self.available_questions = {}  # Track available questions per chat
+        self._group_index = defaultdict(set)  # Map chat_id -> user_ids that participated in it
+        self._global_ranking = _Ranking()  # Users ordered for the global leaderboard
+        self._group_rankings = defaultdict(_Ranking)  # Users ordered per group leaderboard
+        self._totals = {'total_attempts': 0, 'correct_answers': 0}  # Running sums across all users
+        self._daily_attempts = defaultdict(int)  # Date -> attempts across all users
+        self._daily_correct = defaultdict(int)  # Date -> correct answers across all users
+        self._daily_joins = defaultdict(int)  # Date -> users who joined that day
+        self._last_active_counts = defaultdict(int)  # Date -> users whose last activity was that day
+        self._group_last_active = {}  # chat_id -> latest activity date of any member
+        self._private_users = set()  # Users with private chat messages
 
         # Initialize basic data
         self._initialize_files()
         self._last_save = datetime.now()
         self._save_interval = timedelta(minutes=5)
+        self._last_hash = {}  # Hash of the last content written per file
+
+        # Initialize write-behind saving
+        self._dirty = set()  # Names of data sets changed since the last save
+        self._save_lock = threading.Lock()
+        self._save_event = threading.Event()
+        self._save_delay = 2  # Seconds to coalesce bursts of changes into one save
+
+        # Per-user stats and score changes are appended to a journal and folded into the files periodically
+        self._journal_users = set()  # User ids whose stats changed since the last save
+        self._last_compaction = datetime.now()
+        self._journal_max_bytes = 1024 * 1024
+        self._journal_handle = None  # Buffered append handle, opened on first use
+        self._journaled_users = set()  # User ids with records in the journal or the retired journal
 
         # Load data after all structures are initialized
         self.load_data()
 
+        # Flush changes in the background instead of on every mutation
+        self._save_thread = threading.Thread(target=self._save_worker, name="quiz-save-worker", daemon=True)
+        self._save_thread.start()
+        atexit.register(self._final_flush)
+
     def _initialize_files(self):
         """Initialize data files with proper error handling"""
         try:
@@ -54,28 +201,45 @@ class QuizManager:
                 self.stats_file: {}
             }
             for file_path, default_data in default_files.items():
-                if not os.path.exists(file_path):
-                    with open(file_path, 'w') as f:
-                        json.dump(default_data, f)
+                self._ensure_file(file_path, default_data)
         except Exception as e:
             logger.error(f"Error initializing files: {e}")
             raise
 
+    def _ensure_file(self, file_path: str, default_data: Any) -> bool:
+        """Atomically create file_path with default_data if it does not exist yet"""
+        try:
+            fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+        except FileExistsError:
+            return False
+
+        with os.fdopen(fd, 'wb') as f:
+            f.write(_dumps(default_data))
+        return True
+
     def load_data(self):
         """Load all data with proper error handling"""
         try:
             # Ensure data directory exists
             os.makedirs("data", exist_ok=True)
 
+            # Flush changes still queued for the save worker so re-reading the files does not drop them
+            if self._dirty or self._journal_users:
+                self.save_data(force=True)
+
+            # Note which data files differ from what this process last saved
+            changed = set()
+
             # Initialize questions with defaults if file is empty or corrupted
             try:
-                if not os.path.exists(self.questions_file):
-                    with open(self.questions_file, 'w') as f:
-                        json.dump([], f)
-                        logger.info("Created new questions file")
-
-                with open(self.questions_file, 'r') as f:
-                    raw_data = json.load(f)
+                if self._ensure_file(self.questions_file, []):
+                    logger.info("Created new questions file")
+
+                with open(self.questions_file, 'rb') as f:
+                    raw = f.read()
+                    if self._last_hash.get(self.questions_file) != hash(raw):
+                        changed.add('questions')
+                    raw_data = _loads(raw)
                     if isinstance(raw_data, dict) and 'questions' in raw_data:
                         raw_questions = raw_data['questions']
                     elif isinstance(raw_data, list):
@@ -86,6 +250,7 @@ class QuizManager:
             except (json.JSONDecodeError, FileNotFoundError) as e:
                 logger.warning(f"Questions file error: {e}, initializing with defaults")
                 raw_questions = []
+                changed.add('questions')
 
             # Clean up existing questions
             self.questions = []
@@ -123,26 +288,64 @@ class QuizManager:
                 (self.stats_file, {}, 'stats')
             ]:
                 try:
-                    if not os.path.exists(file_path):
-                        with open(file_path, 'w') as f:
-                            json.dump(default_value, f)
-                            logger.info(f"Created new file: {file_path}")
-
-                    with open(file_path, 'r') as f:
-                        setattr(self, attr_name, json.load(f))
+                    if self._ensure_file(file_path, default_value):
+                        logger.info(f"Created new file: {file_path}")
+
+                    with open(file_path, 'rb') as f:
+                        raw = f.read()
+                    setattr(self, attr_name, _loads(raw))
+                    if self._last_hash.get(file_path) != hash(raw):
+                        changed.add(attr_name)
                 except (json.JSONDecodeError, FileNotFoundError) as e:
                     logger.warning(f"Error loading {file_path}: {e}, using defaults")
                     setattr(self, attr_name, default_value)
+                    changed.add(attr_name)
+            self.active_chats = set(self.active_chats)
+
+            # Replay per-user stats changes not yet compacted into the stats file
+            self._replay_stats_journal()
+
+            # Trim activity history beyond the retention window
+            cutoff = (datetime.now() - timedelta(days=_DAILY_ACTIVITY_DAYS)).strftime('%Y-%m-%d')
+            for user_stats in self.stats.values():
+                _trim_daily_activity(user_stats.get('daily_activity', {}), cutoff)
+                for group_stats in user_stats.get('groups', {}).values():
+                    _trim_daily_activity(group_stats.get('daily_activity', {}), cutoff)
+
+            # Reconcile stats with scores once here, so reads never have to
+            for user_id, user_stats in self.stats.items():
+                score = self.scores.get(user_id, 0)
+                if score != user_stats.get('correct_answers', 0):
+                    logger.info(f"Syncing score for user {user_id}: {score} != {user_stats.get('correct_answers', 0)}")
+                    changed.add('stats')
+                    user_stats['correct_answers'] = score
+                    user_stats['total_quizzes'] = max(user_stats.get('total_quizzes', 0), score)
 
             # Reset tracking structures
+            self._rebuild_question_index()
             self.recent_questions.clear()
             self.last_question_time.clear()
             self.available_questions.clear()
+            self._rebuild_group_index()
+            self._rebuild_rankings()
+            self._rebuild_aggregates()
 
             # Clear caches
             self._cached_questions = None
             self._cached_leaderboard = None
-            self._leaderboard_cache_time = None
+            self._leaderboard_dirty = True
+            self._group_leaderboard_cache.clear()
+            self._user_stats_cache.clear()
+            self._global_stats_cache = None
+
+            # Data that differs from the last save is a change for version-keyed caches; a reload that
+            # read back the same stats and scores keeps update_all_stats' result valid
+            if changed:
+                self._mutation_seq += 1
+                if 'stats' in changed or 'scores' in changed:
+                    self._all_stats_updated = None
+                elif self._all_stats_updated:
+                    self._all_stats_updated = (self._all_stats_updated[0], self._mutation_seq)
 
             # Force save to ensure clean data
             self.save_data(force=True)
@@ -156,35 +359,389 @@ class QuizManager:
             logger.error(f"Critical error loading data: {str(e)}\n{traceback.format_exc()}")
             raise
 
+    def _rebuild_question_index(self) -> None:
+        """Rebuild the set of normalized question texts used for duplicate detection"""
+        self._question_text_set = {q['question'].strip().casefold() for q in self.questions}
+
+    def _rebuild_group_index(self) -> None:
+        """Rebuild the chat_id -> user_ids index from the loaded stats"""
+        self._group_index.clear()
+        for user_id, stats in self.stats.items():
+            for chat_id in stats.get('groups', {}):
+                self._group_index[chat_id].add(user_id)
+
+    def _leaderboard_key(self, user_id: str) -> tuple:
+        """Global ranking key: score, then accuracy, then current streak, all descending"""
+        stats = self.stats[user_id]
+        total_attempts = stats['total_quizzes']
+        accuracy = (stats['correct_answers'] / total_attempts * 100) if total_attempts > 0 else 0
+        return (-self.scores.get(user_id, 0), -round(accuracy, 1), -stats.get('current_streak', 0))
+
+    def _group_leaderboard_key(self, group_stats: Dict) -> tuple:
+        """Group ranking key: group score, then accuracy, both descending"""
+        total_attempts = group_stats.get('total_quizzes', 0)
+        correct_answers = group_stats.get('correct_answers', 0)
+        accuracy = (correct_answers / total_attempts * 100) if total_attempts > 0 else 0
+        return (-group_stats.get('score', 0), -round(accuracy, 1))
+
+    def _update_rankings(self, user_id: str, chat_id: str = None) -> None:
+        """Reposition a user in the global ranking and, if given, one group ranking"""
+        # The cached global leaderboard only shows the top 10, so changes below it leave it valid
+        if self._global_ranking.update(user_id, self._leaderboard_key(user_id)) < 10:
+            self._leaderboard_dirty = True
+        if chat_id is not None:
+            group_stats = self.stats[user_id]['groups'][chat_id]
+            self._group_rankings[chat_id].update(user_id, self._group_leaderboard_key(group_stats))
+            self._group_leaderboard_cache.pop(chat_id, None)
+
+    def _rebuild_rankings(self) -> None:
+        """Rebuild the global and per-group rankings from the loaded stats"""
+        group_keys = defaultdict(list)
+        for user_id, stats in self.stats.items():
+            for chat_id, group_stats in stats.get('groups', {}).items():
+                group_keys[chat_id].append((user_id, self._group_leaderboard_key(group_stats)))
+
+        self._global_ranking = _Ranking()
+        self._global_ranking.load((user_id, self._leaderboard_key(user_id)) for user_id in self.stats)
+        self._group_rankings.clear()
+        for chat_id, pairs in group_keys.items():
+            self._group_rankings[chat_id].load(pairs)
+        self._leaderboard_dirty = True
+        self._group_leaderboard_cache.clear()
+
+    def _rebuild_aggregates(self) -> None:
+        """Recompute the running totals and activity summaries used by get_global_statistics"""
+        self._daily_attempts.clear()
+        self._daily_correct.clear()
+        self._daily_joins.clear()
+        self._last_active_counts.clear()
+        self._group_last_active.clear()
+        self._private_users.clear()
+
+        # Bind the accumulators locally for the pass over every user
+        daily_attempts = self._daily_attempts
+        daily_correct = self._daily_correct
+        daily_joins = self._daily_joins
+        last_active_counts = self._last_active_counts
+        note_group_activity = self._note_group_activity
+        private_users = self._private_users
+        total_attempts = correct_answers = 0
+
+        for user_id, stats in self.stats.items():
+            get = stats.get
+            total_attempts += get('total_quizzes', 0)
+            correct_answers += get('correct_answers', 0)
+            for date, day_stats in get('daily_activity', _EMPTY_DICT).items():
+                daily_attempts[date] += day_stats.get('attempts', 0)
+                daily_correct[date] += day_stats.get('correct', 0)
+            join_date = get('join_date')
+            if join_date:
+                daily_joins[join_date] += 1
+
+            last_active = get('last_activity_date')
+            if last_active:
+                last_active_counts[last_active] += 1
+            for chat_id, group_stats in get('groups', _EMPTY_DICT).items():
+                note_group_activity(chat_id, group_stats.get('last_activity_date'))
+            if get('private_chat_activity', _EMPTY_DICT).get('total_messages', 0) > 0:
+                private_users.add(user_id)
+
+        # Per-day user counts keep the same window as daily_activity
+        cutoff = self._calendar().cutoff
+        _trim_daily_activity(last_active_counts, cutoff)
+        _trim_daily_activity(daily_joins, cutoff)
+
+        self._totals = {'total_attempts': total_attempts, 'correct_answers': correct_answers}
+
+    def _set_last_activity(self, stats: Dict, date: str) -> None:
+        """Update a user's last activity date, keeping the per-day active user counts in step"""
+        old_date = stats.get('last_activity_date')
+        if old_date == date:
+            return
+        if old_date in self._last_active_counts:
+            self._last_active_counts[old_date] -= 1
+            if self._last_active_counts[old_date] <= 0:
+                del self._last_active_counts[old_date]
+        self._count_day(self._last_active_counts, date)
+        stats['last_activity_date'] = date
+
+    def _count_day(self, counts: Dict, date: str) -> None:
+        """Add one to a per-day count, dropping days outside the retained window when a new day starts"""
+        if date not in counts:
+            _trim_daily_activity(counts, self._calendar().cutoff)
+        counts[date] += 1
+
+    def _note_group_activity(self, chat_id: str, date: Optional[str]) -> None:
+        """Record activity in a group if it is later than what is known"""
+        if date and date > self._group_last_active.get(chat_id, ''):
+            self._group_last_active[chat_id] = date
+
+    def _sync_score(self, user_id: str, stats: Dict, score: int) -> None:
+        """Align a user's correct answers with their score, keeping totals and rankings current"""
+        total_quizzes = max(stats['total_quizzes'], score)
+        self._totals['correct_answers'] += score - stats['correct_answers']
+        self._totals['total_attempts'] += total_quizzes - stats['total_quizzes']
+        stats['correct_answers'] = score
+        stats['total_quizzes'] = total_quizzes
+        self._update_rankings(user_id)
+
     def save_data(self, force=False):
         """Save data with throttling to prevent excessive writes"""
         current_time = datetime.now()
         if not force and current_time - self._last_save < self._save_interval:
             return
 
+        with self._save_lock:
+            dirty = self._take_dirty(self._dirty)
+            journal_users = self._take_dirty(self._journal_users)
+            try:
+                # An explicit save with nothing flagged writes every file
+                write_all = not (dirty or journal_users)
+
+                # Fold the journal into the stats and scores files when due, otherwise just append to it
+                compact_stats = (
+                    write_all
+                    or 'stats' in dirty
+                    or 'scores' in dirty
+                    or current_time - self._last_compaction >= self._save_interval
+                    or self._journal_size() >= self._journal_max_bytes
+                )
+                if journal_users and not compact_stats:
+                    self._append_stats_journal(journal_users)
+                elif compact_stats:
+                    dirty.update(('stats', 'scores'))
+                    self._retire_stats_journal()
+
+                # Write only the changed files, or everything if nothing was flagged
+                for name in self._data_files if write_all else dirty:
+                    file_path, compact = self._data_files[name]
+                    data = getattr(self, name)
+                    if isinstance(data, set):
+                        data = sorted(data)
+                    if self._write_json(file_path, data, compact) and name == 'questions':
+                        logger.info(f"Saved {len(self.questions)} questions to file")
+
+                if compact_stats:
+                    self._discard_retired_journal()
+                    self._last_compaction = current_time
+
+                self._last_save = current_time
+                logger.info(f"Data saved successfully ({'all files' if write_all else ', '.join(sorted(dirty))}). "
+                            f"Questions count: {len(self.questions)}")
+            except Exception as e:
+                self._dirty.update(dirty)
+                self._journal_users.update(journal_users)
+                logger.error(f"Error saving data: {str(e)}\n{traceback.format_exc()}")
+                raise
+
+    def _take_dirty(self, pending: set) -> set:
+        """Drain a pending set; entries flagged concurrently stay queued for the next save"""
+        dirty = set()
+        while pending:
+            try:
+                dirty.add(pending.pop())
+            except KeyError:
+                break
+        return dirty
+
+    def _mark_dirty(self, *names: str) -> None:
+        """Flag data sets as changed and wake the background save worker"""
+        self._dirty.update(names)
+        self._mutation_seq += 1
+        self._save_event.set()
+
+    def _mark_stats_dirty(self, user_id: str, *names: str) -> None:
+        """Flag a single user's stats (plus any other data sets) as changed"""
+        self._journal_users.add(user_id)
+        self._mark_dirty(*names)
+
+    def _journal_size(self) -> int:
+        """Size in bytes of the stats journal, 0 if it does not exist"""
         try:
-            # Save questions file with proper JSON formatting
-            with open(self.questions_file, 'w') as f:
-                json.dump(self.questions, f, indent=2)
-                logger.info(f"Saved {len(self.questions)} questions to file")
-
-            # Save other data files
-            with open(self.scores_file, 'w') as f:
-                json.dump(self.scores, f, indent=2)
-            with open(self.active_chats_file, 'w') as f:
-                json.dump(self.active_chats, f, indent=2)
-            with open(self.stats_file, 'w') as f:
-                json.dump(self.stats, f, indent=2)
-
-            self._last_save = current_time
-            logger.info(f"All data saved successfully. Questions count: {len(self.questions)}")
-        except Exception as e:
-            logger.error(f"Error saving data: {str(e)}\n{traceback.format_exc()}")
+            return os.path.getsize(self.stats_journal_file)
+        except OSError:
+            return 0
+
+    def _append_stats_journal(self, user_ids: set) -> None:
+        """Append the current stats and score of the given users to the journal, one JSON record per line"""
+        records = b''.join(
+            _dumps({'uid': user_id, 'stats': self.stats[user_id], 'score': self.scores.get(user_id)}, compact=True) + b'\n'
+            for user_id in user_ids if user_id in self.stats
+        )
+        if self._journal_handle is None:
+            self._journal_handle = open(self.stats_journal_file, 'ab', buffering=65536)
+        # Flushed to the OS per batch; compaction fsyncs the snapshot files
+        self._journal_handle.write(records)
+        self._journal_handle.flush()
+        self._journaled_users.update(user_id for user_id in user_ids if user_id in self.stats)
+
+    def _close_stats_journal(self) -> None:
+        """Close the journal append handle if it is open"""
+        if self._journal_handle is not None:
+            self._journal_handle.close()
+            self._journal_handle = None
+
+    def _retire_stats_journal(self) -> None:
+        """Set the journal aside before the stats and scores snapshots are written.
+
+        Every journaled user first gets a closing record with their current state, so replaying the
+        retired journal after a crash part way through compaction can never roll the new snapshot back.
+        """
+        if self._journaled_users:
+            self._append_stats_journal(self._journaled_users)
+        self._close_stats_journal()
+        if not self._journal_size():
+            return
+        if os.path.exists(self.retired_journal_file):
+            # An earlier compaction did not finish; keep its records ahead of the newer ones
+            with open(self.stats_journal_file, 'rb') as src, open(self.retired_journal_file, 'ab') as dst:
+                dst.write(src.read())
+                dst.flush()
+                os.fsync(dst.fileno())
+            os.remove(self.stats_journal_file)
+        else:
+            os.replace(self.stats_journal_file, self.retired_journal_file)
+
+    def _discard_retired_journal(self) -> None:
+        """Delete the retired journal once the snapshots holding its records are on disk"""
+        try:
+            os.remove(self.retired_journal_file)
+        except FileNotFoundError:
+            pass
+        self._journaled_users.clear()
+
+    def _replay_stats_journal(self) -> None:
+        """Apply retired and current journal records on top of the loaded stats; later records win"""
+        replayed = 0
+        for journal_file in (self.retired_journal_file, self.stats_journal_file):
+            try:
+                with open(journal_file, 'rb') as f:
+                    lines = f.read().splitlines()
+            except FileNotFoundError:
+                continue
+
+            for line in lines:
+                try:
+                    record = _loads(line)
+                    self.stats[record['uid']] = record['stats']
+                    if record.get('score') is not None:
+                        self.scores[record['uid']] = record['score']
+                    self._journaled_users.add(record['uid'])
+                    replayed += 1
+                except (ValueError, KeyError, TypeError):
+                    # A torn final line from an interrupted append
+                    logger.warning("Skipping unreadable stats journal record")
+        if replayed:
+            logger.info(f"Replayed {replayed} stats journal records")
+
+    def _save_worker(self) -> None:
+        """Background loop that persists dirty data, coalescing bursts of changes"""
+        while True:
+            self._save_event.wait()
+            time.sleep(self._save_delay)
+            self._save_event.clear()
+            if not (self._dirty or self._journal_users):
+                continue
+            try:
+                self.save_data(force=True)
+            except Exception:
+                # save_data already logged the failure; retry on the next change
+                continue
+
+    def _final_flush(self) -> None:
+        """Persist any pending changes at interpreter exit, compacting the journal"""
+        if self._dirty or self._journal_users or self._journaled_users:
+            try:
+                self._dirty.add('stats')
+                self.save_data(force=True)
+            except Exception as e:
+                logger.error(f"Error flushing data on exit: {e}")
+        self._close_stats_journal()
+
+    def _write_json(self, file_path: str, data: Any, compact: bool = False) -> bool:
+        """Write data to file as JSON, skipping the write if content is unchanged"""
+        content = _dumps(data, compact)
+        content_hash = hash(content)
+        if self._last_hash.get(file_path) == content_hash:
+            return False
+
+        self._atomic_write(file_path, content)
+        self._last_hash[file_path] = content_hash
+        return True
+
+    def _atomic_write(self, file_path: str, content: bytes) -> None:
+        """Write content to a temp file and rename it over file_path so readers never see a partial file"""
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(file_path) or '.', suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(content)
+                f.flush()
+                os.fsync(f.fileno())
+            os.chmod(tmp_path, 0o644)
+            os.replace(tmp_path, file_path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
             raise
 
+    def _period_starts(self, now: datetime) -> tuple:
+        """Return the (week_start, month_start) dates for now as YYYY-MM-DD strings"""
+        week_start = (now - timedelta(days=now.weekday())).strftime('%Y-%m-%d')
+        month_start = now.replace(day=1).strftime('%Y-%m-%d')
+        return week_start, month_start
+
+    def _calendar(self) -> _Calendar:
+        """Return today's dates as YYYY-MM-DD strings, recomputed once a day"""
+        if time.time() >= self._calendar_expires:
+            now = datetime.now()
+            midnight = datetime.combine(now.date() + _ONE_DAY, datetime.min.time())
+            week_start, month_start = self._period_starts(now)
+            self._calendar_dates = _Calendar(
+                today=now.strftime('%Y-%m-%d'),
+                yesterday=(now - _ONE_DAY).strftime('%Y-%m-%d'),
+                cutoff=(now - timedelta(days=_DAILY_ACTIVITY_DAYS)).strftime('%Y-%m-%d'),
+                week_start=week_start,
+                month_start=month_start,
+                week_ago=(now - timedelta(days=7)).strftime('%Y-%m-%d')
+            )
+            self._calendar_expires = midnight.timestamp()
+        return self._calendar_dates
+
+    def _roll_period_counters(self, stats: Dict, week_start: str, month_start: str) -> bool:
+        """Reset the running week/month attempt counters when a new period starts.
+
+        Stats saved before the counters existed are backfilled once from daily_activity.
+        Returns True if stats was modified.
+        """
+        if 'week_start_date' not in stats:
+            daily_activity = stats.get('daily_activity', {})
+            stats['week_attempts'] = sum(
+                day_stats['attempts'] for date, day_stats in daily_activity.items() if date >= week_start
+            )
+            stats['month_attempts'] = sum(
+                day_stats['attempts'] for date, day_stats in daily_activity.items() if date >= month_start
+            )
+            stats['week_start_date'] = week_start
+            stats['month_start_date'] = month_start
+            return True
+
+        changed = False
+        if stats['week_start_date'] != week_start:
+            stats['week_start_date'] = week_start
+            stats['week_attempts'] = 0
+            changed = True
+        if stats['month_start_date'] != month_start:
+            stats['month_start_date'] = month_start
+            stats['month_attempts'] = 0
+            changed = True
+        return changed
+
     def _init_user_stats(self, user_id: str) -> None:
         """Initialize stats for a new user with enhanced tracking"""
-        current_date = datetime.now().strftime('%Y-%m-%d')
+        calendar = self._calendar()
+        current_date = calendar.today
         self.stats[user_id] = {
             'total_quizzes': 0,
             'correct_answers': 0,
@@ -198,6 +755,10 @@ class QuizManager:
                     'correct': 0
                 }
             },
+            'week_attempts': 0,
+            'month_attempts': 0,
+            'week_start_date': calendar.week_start,
+            'month_start_date': calendar.month_start,
             'last_quiz_date': current_date,
             'last_activity_date': current_date,
             'join_date': current_date,
@@ -207,21 +768,32 @@ class QuizManager:
                 'last_active': current_date
             }
         }
+        self._count_day(self._last_active_counts, current_date)
+        self._count_day(self._daily_joins, current_date)
+        self._update_rankings(user_id)
 
     def get_user_stats(self, user_id: int) -> Dict:
         """Get comprehensive stats for a user"""
         try:
             user_id_str = str(user_id)
-            current_date = datetime.now().strftime('%Y-%m-%d')
+            now = datetime.now()
+
+            # Serve repeat reads from the cache while the entry is fresh and from the same day
+            cached = self._user_stats_cache.get(user_id_str)
+            if cached and now - cached[0] < self._user_stats_ttl and cached[0].date() == now.date():
+                self._user_stats_cache.move_to_end(user_id_str)
+                return dict(cached[1])
 
-            logger.info(f"Attempting to get stats for user {user_id}")
-            logger.debug(f"Current stats data: {self.stats.get(user_id_str, 'Not Found')}")
+            calendar = self._calendar()
+            current_date = calendar.today
+
+            logger.debug("Getting stats for user %s", user_id)
 
             # Initialize stats if user doesn't exist
             if user_id_str not in self.stats:
                 logger.info(f"Initializing new stats for user {user_id}")
                 self._init_user_stats(user_id_str)
-                self.save_data(force=True)
+                self._mark_stats_dirty(user_id_str)
 
                 # Return initial stats
                 return {
@@ -237,31 +809,16 @@ class QuizManager:
                 }
 
             stats = self.stats[user_id_str]
-            logger.debug(f"Retrieved raw stats: {stats}")
-
-            # Ensure today's activity exists
-            if current_date not in stats['daily_activity']:
-                stats['daily_activity'][current_date] = {'attempts': 0, 'correct': 0}
-                self.save_data()
+            logger.debug("Retrieved raw stats for user %s: %s", user_id, stats)
 
-            # Get today's stats
-            today_stats = stats['daily_activity'].get(current_date, {'attempts': 0, 'correct': 0})
+            # Get today's stats; record_attempt creates the entry, so reads need not write one
+            today_stats = stats['daily_activity'].get(current_date, _NO_ACTIVITY)
 
-            # Calculate weekly stats
-            week_start = (datetime.now() - timedelta(days=datetime.now().weekday())).strftime('%Y-%m-%d')
-            week_quizzes = sum(
-                day_stats['attempts']
-                for date, day_stats in stats['daily_activity'].items()
-                if date >= week_start
-            )
-
-            # Calculate monthly stats
-            month_start = datetime.now().replace(day=1).strftime('%Y-%m-%d')
-            month_quizzes = sum(
-                day_stats['attempts']
-                for date, day_stats in stats['daily_activity'].items()
-                if date >= month_start
-            )
+            # Read weekly and monthly stats from the running counters; a rollover here is
+            # repeated by any later reader or attempt, so the read does not schedule a save
+            self._roll_period_counters(stats, calendar.week_start, calendar.month_start)
+            week_quizzes = stats['week_attempts']
+            month_quizzes = stats['month_attempts']
 
             # Calculate success rate
             if stats['total_quizzes'] > 0:
@@ -269,14 +826,6 @@ class QuizManager:
             else:
                 success_rate = 0.0
 
-            # Sync with scores data
-            score = self.scores.get(user_id_str, 0)
-            if score != stats['correct_answers']:
-                logger.info(f"Syncing score for user {user_id}: {score} != {stats['correct_answers']}")
-                stats['correct_answers'] = score
-                stats['total_quizzes'] = max(stats['total_quizzes'], score)
-                self.save_data(force=True)
-
             formatted_stats = {
                 'total_quizzes': stats['total_quizzes'],
                 'correct_answers': stats['correct_answers'],
@@ -289,8 +838,14 @@ class QuizManager:
                 'longest_streak': stats.get('longest_streak', 0)
             }
 
-            logger.info(f"Successfully retrieved stats for user {user_id}: {formatted_stats}")
-            return formatted_stats
+            # Cache the result, evicting the least recently used entry when full
+            self._user_stats_cache[user_id_str] = (now, formatted_stats)
+            self._user_stats_cache.move_to_end(user_id_str)
+            if len(self._user_stats_cache) > self._user_stats_cache_size:
+                self._user_stats_cache.popitem(last=False)
+
+            logger.debug("Retrieved stats for user %s: %s", user_id, formatted_stats)
+            return dict(formatted_stats)
 
         except Exception as e:
             logger.error(f"Error getting stats for user {user_id}: {str(e)}\n{traceback.format_exc()}")
@@ -300,85 +855,92 @@ class QuizManager:
     def get_group_leaderboard(self, chat_id: int) -> Dict:
         """Get group-specific leaderboard with detailed analytics"""
         chat_id_str = str(chat_id)
-        current_date = datetime.now()
-        today = current_date.strftime('%Y-%m-%d')
-        week_start = (current_date - timedelta(days=current_date.weekday())).strftime('%Y-%m-%d')
-        month_start = current_date.replace(day=1).strftime('%Y-%m-%d')
+        calendar = self._calendar()
+        today = calendar.today
 
-        # Initialize counters and sets
+        # Reuse the cached result until the group changes or the day rolls over
+        cached = self._group_leaderboard_cache.get(chat_id_str)
+        if cached and cached[0] == today:
+            return cached[1]
+
+        # Initialize counters; group members are unique, so plain counts replace per-call sets
         total_group_quizzes = 0
         total_correct_answers = 0
         active_users = {
-            'today': set(),
-            'week': set(),
-            'month': set(),
-            'total': set()
+            'today': 0,
+            'week': 0,
+            'month': 0,
+            'total': 0
         }
-        leaderboard = []
 
-        # Process user stats
-        for user_id, stats in self.stats.items():
-            if chat_id_str in stats.get('groups', {}):
-                group_stats = stats['groups'][chat_id_str]
-                active_users['total'].add(user_id)
-
-                # Update activity counters
-                last_activity = group_stats.get('last_activity_date')
-                if last_activity:
-                    if last_activity == today:
-                        active_users['today'].add(user_id)
-                    if last_activity >= week_start:
-                        active_users['week'].add(user_id)
-                    if last_activity >= month_start:
-                        active_users['month'].add(user_id)
-
-                # Calculate user statistics
-                user_total_attempts = group_stats.get('total_quizzes', 0)
-                user_correct_answers = group_stats.get('correct_answers', 0)
-                total_group_quizzes += user_total_attempts
-                total_correct_answers += user_correct_answers
-
-                # Get daily activity stats
-                daily_stats = group_stats.get('daily_activity', {})
-                today_stats = daily_stats.get(today, {'attempts': 0, 'correct': 0})
-
-                leaderboard.append({
-                    'user_id': int(user_id),
-                    'total_attempts': user_total_attempts,
-                    'correct_answers': user_correct_answers,
-                    'wrong_answers': user_total_attempts - user_correct_answers,
-                    'accuracy': round((user_correct_answers / user_total_attempts * 100) if user_total_attempts > 0 else 0, 1),
-                    'score': group_stats.get('score', 0),
-                    'current_streak': group_stats.get('current_streak', 0),
-                    'longest_streak': group_stats.get('longest_streak', 0),
-                    'today_attempts': today_stats['attempts'],
-                    'today_correct': today_stats['correct'],
-                    'last_active': group_stats.get('last_activity_date', 'Never')
-                })
+        # Process only the users known to have participated in this group; the index guarantees the entry exists
+        all_stats = self.stats
+        members = self._group_index.get(chat_id_str, ())
+        active_users['total'] = len(members)
+        for user_id in members:
+            group_stats = all_stats[user_id]['groups'][chat_id_str]
+
+            # Update activity counters
+            last_activity = group_stats.get('last_activity_date')
+            if last_activity:
+                if last_activity == today:
+                    active_users['today'] += 1
+                if last_activity >= calendar.week_start:
+                    active_users['week'] += 1
+                if last_activity >= calendar.month_start:
+                    active_users['month'] += 1
+
+            # Calculate user statistics
+            user_total_attempts = group_stats.get('total_quizzes', 0)
+            user_correct_answers = group_stats.get('correct_answers', 0)
+            total_group_quizzes += user_total_attempts
+            total_correct_answers += user_correct_answers
+
+        # Build entries only for the top 10 of the pre-sorted group ranking (score, then accuracy)
+        top_users = self._group_rankings[chat_id_str].top(10) if chat_id_str in self._group_rankings else []
+        leaderboard = []
+        for user_id in top_users:
+            group_stats = self.stats[user_id]['groups'][chat_id_str]
+            user_total_attempts = group_stats.get('total_quizzes', 0)
+            user_correct_answers = group_stats.get('correct_answers', 0)
+
+            # Get daily activity stats
+            daily_stats = group_stats.get('daily_activity', {})
+            today_stats = daily_stats.get(today, _NO_ACTIVITY)
+
+            leaderboard.append({
+                'user_id': int(user_id),
+                'total_attempts': user_total_attempts,
+                'correct_answers': user_correct_answers,
+                'wrong_answers': user_total_attempts - user_correct_answers,
+                'accuracy': round((user_correct_answers / user_total_attempts * 100) if user_total_attempts > 0 else 0, 1),
+                'score': group_stats.get('score', 0),
+                'current_streak': group_stats.get('current_streak', 0),
+                'longest_streak': group_stats.get('longest_streak', 0),
+                'today_attempts': today_stats['attempts'],
+                'today_correct': today_stats['correct'],
+                'last_active': group_stats.get('last_activity_date', 'Never')
+            })
 
-        # Sort leaderboard by score and accuracy
-        leaderboard.sort(key=lambda x: (x['score'], x['accuracy']), reverse=True)
         group_accuracy = (total_correct_answers / total_group_quizzes * 100) if total_group_quizzes > 0 else 0
 
-        return {
+        result = {
             'total_quizzes': total_group_quizzes,
             'total_correct': total_correct_answers,
             'group_accuracy': round(group_accuracy, 1),
-            'active_users': {
-                'today': len(active_users['today']),
-                'week': len(active_users['week']),
-                'month': len(active_users['month']),
-                'total': len(active_users['total'])
-            },
-            'leaderboard': leaderboard[:10]  # Top 10 performers
+            'active_users': active_users,
+            'leaderboard': leaderboard  # Top 10 performers
         }
+        self._group_leaderboard_cache[chat_id_str] = (today, result)
+        return result
 
     def record_group_attempt(self, user_id: int, chat_id: int, is_correct: bool) -> None:
         """Record a quiz attempt for a user in a specific group with timestamp"""
         try:
             user_id_str = str(user_id)
             chat_id_str = str(chat_id)
-            current_date = datetime.now().strftime('%Y-%m-%d')
+            calendar = self._calendar()
+            current_date = calendar.today
 
             # Initialize user stats if needed
             if user_id_str not in self.stats:
@@ -402,12 +964,16 @@ class QuizManager:
                     'last_correct_date': None
                 }
 
+            self._group_index[chat_id_str].add(user_id_str)
+
             group_stats = stats['groups'][chat_id_str]
             group_stats['total_quizzes'] += 1
             group_stats['last_activity_date'] = current_date
+            self._note_group_activity(chat_id_str, current_date)
 
-            # Update daily activity
+            # Update daily activity, trimming old days when a new one starts
             if current_date not in group_stats['daily_activity']:
+                _trim_daily_activity(group_stats['daily_activity'], calendar.cutoff)
                 group_stats['daily_activity'][current_date] = {'attempts': 0, 'correct': 0}
 
             group_stats['daily_activity'][current_date]['attempts'] += 1
@@ -418,29 +984,38 @@ class QuizManager:
                 group_stats['daily_activity'][current_date]['correct'] += 1
 
                 # Update streak
-                if group_stats.get('last_correct_date') == (datetime.now() - timedelta(days=1)).strftime('%Y-%m-%d'):
-                    group_stats['current_streak'] += 1
+                if group_stats.get('last_correct_date') == calendar.yesterday:
+                    current_streak = group_stats['current_streak'] + 1
                 else:
-                    group_stats['current_streak'] = 1
+                    current_streak = 1
+                group_stats['current_streak'] = current_streak
 
-                group_stats['longest_streak'] = max(group_stats['current_streak'], group_stats['longest_streak'])
+                if current_streak > group_stats['longest_streak']:
+                    group_stats['longest_streak'] = current_streak
                 group_stats['last_correct_date'] = current_date
             else:
                 group_stats['current_streak'] = 0
 
-            # Also record the attempt in user's general stats
+            # Also record the attempt in user's general stats, which schedules the save for this user
             self.record_attempt(user_id, is_correct)
-            self.save_data()
+            self._update_rankings(user_id_str, chat_id_str)
 
         except Exception as e:
             logger.error(f"Error recording group attempt: {e}")
             raise
 
-    def _initialize_available_questions(self, chat_id: int):
+    def _initialize_available_questions(self, chat_id_str: str):
         """Initialize or reset available questions for a chat"""
-        self.available_questions[chat_id] = list(range(len(self.questions)))
-        random.shuffle(self.available_questions[chat_id])
-        logger.info(f"Initialized question pool for chat {chat_id} with {len(self.questions)} questions")
+        question_count = len(self.questions)
+        self.available_questions[chat_id_str] = random.sample(range(question_count), question_count)
+        logger.info(f"Initialized question pool for chat {chat_id_str} with {question_count} questions")
+
+    def _recent(self, chat_id_str: str) -> deque:
+        """Return the recent-questions deque for a chat, creating it on first use"""
+        recent = self.recent_questions.get(chat_id_str)
+        if recent is None:
+            recent = self.recent_questions[chat_id_str] = deque(maxlen=50)
+        return recent
 
     def get_random_question(self, chat_id: int = None) -> Optional[Dict[str, Any]]:
         """Get a random question avoiding recent ones with improved tracking"""
@@ -452,27 +1027,40 @@ class QuizManager:
             if not chat_id:
                 return random.choice(self.questions)
 
+            # Chat-keyed tracking uses string ids, like stats and active chat cleanup
+            chat_id_str = str(chat_id)
+
             # Initialize available questions if needed
-            if chat_id not in self.available_questions or not self.available_questions[chat_id]:
+            if not self.available_questions.get(chat_id_str):
                 logger.info(f"Initializing question pool for chat {chat_id}")
-                self._initialize_available_questions(chat_id)
+                self._initialize_available_questions(chat_id_str)
 
             # Get the next question index from the shuffled list
-            question_index = self.available_questions[chat_id].pop()
+            question_index = self.available_questions[chat_id_str].pop()
             question = self.questions[question_index]
 
-            # Track this question
-            self.recent_questions[chat_id].append(question['question'])
-            self.last_question_time[chat_id][question['question']] = datetime.now()
+            # Track this question by index, dropping the timestamp of the one it evicts
+            recent = self._recent(chat_id_str)
+            evicted = recent[0] if len(recent) == recent.maxlen else None
+            recent.append(question_index)
+            question_times = self.last_question_time.get(chat_id_str)
+            if question_times is None:
+                question_times = self.last_question_time[chat_id_str] = {}
+            if evicted is not None and evicted not in recent:
+                question_times.pop(evicted, None)
+            # Re-insert so the dict stays ordered oldest first, letting cleanup stop at the first fresh entry
+            question_times.pop(question_index, None)
+            question_times[question_index] = datetime.now()
 
             # If we've used all questions, reset the pool
-            if not self.available_questions[chat_id]:
+            if not self.available_questions[chat_id_str]:
                 logger.info(f"Reset question pool for chat {chat_id}")
-                self._initialize_available_questions(chat_id)
+                self._initialize_available_questions(chat_id_str)
 
-            logger.info(f"Selected question {question_index} for chat {chat_id}. "
-                       f"Question text: {question['question'][:30]}... "
-                       f"Remaining questions: {len(self.available_questions[chat_id])}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Selected question %s for chat %s. Question text: %s... Remaining questions: %s",
+                             question_index, chat_id, question['question'][:30],
+                             len(self.available_questions[chat_id_str]))
             return question
 
         except Exception as e:
@@ -481,23 +1069,23 @@ class QuizManager:
             return random.choice(self.questions)
 
     def get_leaderboard(self) -> List[Dict]:
-        """Get global leaderboard with caching"""
-        current_time = datetime.now()
+        """Get global leaderboard, rebuilt only after a ranked value changes or the day rolls over"""
+        current_date = self._calendar().today
 
-        # Force refresh cache if it's stale
         if (self._cached_leaderboard is None or
-            self._leaderboard_cache_time is None or
-            current_time - self._leaderboard_cache_time > self._cache_duration):
+            self._leaderboard_dirty or
+            self._leaderboard_cache_date != current_date):
 
             leaderboard = []
-            current_date = current_time.strftime('%Y-%m-%d')
 
-            for user_id, stats in self.stats.items():
+            # Only the top 10 of the pre-sorted ranking need entries
+            for user_id in self._global_ranking.top(10):
+                stats = self.stats[user_id]
                 total_attempts = stats['total_quizzes']
                 correct_answers = stats['correct_answers']
 
                 # Get today's performance
-                today_stats = stats['daily_activity'].get(current_date, {'attempts': 0, 'correct': 0})
+                today_stats = stats['daily_activity'].get(current_date, _NO_ACTIVITY)
 
                 accuracy = (correct_answers / total_attempts * 100) if total_attempts > 0 else 0
 
@@ -507,27 +1095,27 @@ class QuizManager:
                     'correct_answers': correct_answers,
                     'wrong_answers': total_attempts - correct_answers,
                     'accuracy': round(accuracy, 1),
-                    'score': self.get_score(int(user_id)),
+                    'score': self.scores.get(user_id, 0),
                     'today_attempts': today_stats['attempts'],
                     'today_correct': today_stats['correct'],
                     'current_streak': stats.get('current_streak', 0),
                     'longest_streak': stats.get('longest_streak', 0)
                 })
 
-            # Sort by score, then accuracy, then streak
-            leaderboard.sort(key=lambda x: (-x['score'], -x['accuracy'], -x['current_streak']))
-            self._cached_leaderboard = leaderboard[:10]
-            self._leaderboard_cache_time = current_time
-            logger.info(f"Refreshed leaderboard cache with {len(leaderboard)} entries")
+            self._cached_leaderboard = leaderboard
+            self._leaderboard_cache_date = current_date
+            self._leaderboard_dirty = False
+            logger.info(f"Refreshed leaderboard cache from {len(self._global_ranking)} ranked users")
 
         return self._cached_leaderboard
 
     def record_attempt(self, user_id: int, is_correct: bool, category: str = None):
         """Record a quiz attempt for a user in real-time"""
         try:
-            user_id_str = str(user_id)
-            current_date = datetime.now().strftime('%Y-%m-%d')
-            logger.info(f"Recording attempt for user {user_id}: correct={is_correct}")
+            user_id_str = user_id if isinstance(user_id, str) else str(user_id)
+            calendar = self._calendar()
+            current_date = calendar.today
+            logger.debug("Recording attempt for user %s: correct=%s", user_id, is_correct)
 
             # Initialize user stats if needed
             if user_id_str not in self.stats:
@@ -536,9 +1124,23 @@ class QuizManager:
             stats = self.stats[user_id_str]
             stats['total_quizzes'] += 1
             stats['last_quiz_date'] = current_date
+            self._user_stats_cache.pop(user_id_str, None)
+
+            # Update global running totals, keeping only recent days
+            self._totals['total_attempts'] += 1
+            if current_date not in self._daily_attempts:
+                _trim_daily_activity(self._daily_attempts, calendar.cutoff)
+                _trim_daily_activity(self._daily_correct, calendar.cutoff)
+            self._daily_attempts[current_date] += 1
 
-            # Initialize today's activity if not exists
+            # Update running week/month counters
+            self._roll_period_counters(stats, calendar.week_start, calendar.month_start)
+            stats['week_attempts'] += 1
+            stats['month_attempts'] += 1
+
+            # Initialize today's activity if not exists, trimming old days when a new one starts
             if current_date not in stats['daily_activity']:
+                _trim_daily_activity(stats['daily_activity'], calendar.cutoff)
                 stats['daily_activity'][current_date] = {'attempts': 0, 'correct': 0}
 
             # Update daily activity
@@ -546,16 +1148,19 @@ class QuizManager:
 
             if is_correct:
                 stats['correct_answers'] += 1
+                self._totals['correct_answers'] += 1
+                self._daily_correct[current_date] += 1
                 stats['daily_activity'][current_date]['correct'] += 1
 
                 # Update streak
-                yesterday = (datetime.now() - timedelta(days=1)).strftime('%Y-%m-%d')
-                if stats.get('last_correct_date') == yesterday:
-                    stats['current_streak'] += 1
+                if stats.get('last_correct_date') == calendar.yesterday:
+                    current_streak = stats['current_streak'] + 1
                 else:
-                    stats['current_streak'] = 1
+                    current_streak = 1
+                stats['current_streak'] = current_streak
 
-                stats['longest_streak'] = max(stats['current_streak'], stats.get('longest_streak', 0))
+                if current_streak > stats.get('longest_streak', 0):
+                    stats['longest_streak'] = current_streak
                 stats['last_correct_date'] = current_date
 
                 # Update score
@@ -573,9 +1178,13 @@ class QuizManager:
             else:
                 stats['current_streak'] = 0
 
-            # Save immediately for real-time tracking
-            self.save_data(force=True)
-            logger.info(f"Successfully recorded attempt for user {user_id}: score={self.scores.get(user_id_str)}, streak={stats['current_streak']}")
+            self._update_rankings(user_id_str)
+
+            # Persist in the background
+            self._mark_stats_dirty(user_id_str)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Recorded attempt for user %s: score=%s, streak=%s",
+                             user_id, self.scores.get(user_id_str), stats['current_streak'])
 
         except Exception as e:
             logger.error(f"Error recording attempt for user {user_id}: {str(e)}\n{traceback.format_exc()}")
@@ -600,13 +1209,19 @@ class QuizManager:
         logger.info(f"Starting to add {len(questions_data)} questions. Current count: {len(self.questions)}")
         added_questions = []
 
+        # Bind hot lookups once for the loop
+        existing = self._question_text_set
+        rejected = stats['rejected']
+        errors = stats['errors']
+        append = added_questions.append
+
         for question_data in questions_data:
             try:
                 # Basic format validation
-                if not all(key in question_data for key in ['question', 'options', 'correct_answer']):
+                if not _QUESTION_KEYS <= question_data.keys():
                     logger.warning(f"Invalid format for question: {question_data}")
-                    stats['rejected']['invalid_format'] += 1
-                    stats['errors'].append(f"Invalid format for question: {question_data.get('question', 'Unknown')}")
+                    rejected['invalid_format'] += 1
+                    errors.append(f"Invalid format for question: {question_data.get('question', 'Unknown')}")
                     continue
 
                 # Clean up question text - remove /addquiz prefix and extra whitespace
@@ -623,7 +1238,7 @@ class QuizManager:
                         correct_answer = int(correct_answer)
                     except ValueError:
                         logger.warning(f"Invalid correct_answer format: {correct_answer}")
-                        stats['rejected']['invalid_format'] += 1
+                        rejected['invalid_format'] += 1
                         continue
 
                 if isinstance(correct_answer, int) and correct_answer > 0:
@@ -632,29 +1247,30 @@ class QuizManager:
                 # Validate question text
                 if not question or len(question) < 5:
                     logger.warning(f"Question text too short: {question}")
-                    stats['rejected']['invalid_format'] += 1
-                    stats['errors'].append(f"Question text too short: {question}")
+                    rejected['invalid_format'] += 1
+                    errors.append(f"Question text too short: {question}")
                     continue
 
-                # Check for duplicates
-                if any(q['question'].lower() == question.lower() for q in self.questions):
+                # Check for duplicates, including earlier questions in this batch
+                normalized_question = question.casefold()
+                if normalized_question in existing:
                     logger.warning(f"Duplicate question detected: {question}")
-                    stats['rejected']['duplicates'] += 1
-                    stats['errors'].append(f"Duplicate question: {question}")
+                    rejected['duplicates'] += 1
+                    errors.append(f"Duplicate question: {question}")
                     continue
 
                 # Validate options
-                if len(options) != 4 or not all(opt for opt in options):
+                if len(options) != 4 or '' in options:
                     logger.warning(f"Invalid options for question: {question}")
-                    stats['rejected']['invalid_options'] += 1
-                    stats['errors'].append(f"Invalid options for question: {question}")
+                    rejected['invalid_options'] += 1
+                    errors.append(f"Invalid options for question: {question}")
                     continue
 
                 # Validate correct answer index
                 if not isinstance(correct_answer, int) or not (0 <= correct_answer < 4):
                     logger.warning(f"Invalid correct answer index for question: {question}")
-                    stats['rejected']['invalid_format'] += 1
-                    stats['errors'].append(f"Invalid correct answer index for question: {question}")
+                    rejected['invalid_format'] += 1
+                    errors.append(f"Invalid correct answer index for question: {question}")
                     continue
 
                 # Add valid question
@@ -663,18 +1279,20 @@ class QuizManager:
                     'options': options,
                     'correct_answer': correct_answer
                 }
-                added_questions.append(question_obj)
+                append(question_obj)
+                existing.add(normalized_question)
                 stats['added'] += 1
-                logger.info(f"Added question: {question}")
+                logger.debug("Added question: %s", question)
 
             except Exception as e:
                 logger.error(f"Error processing question: {str(e)}\n{traceback.format_exc()}")
-                stats['errors'].append(f"Unexpected error: {str(e)}")
+                errors.append(f"Unexpected error: {str(e)}")
 
         if stats['added'] > 0:
             # Update questions list with new questions
             self.questions.extend(added_questions)
             # Force save immediately after adding questions
+            self._mark_dirty('questions')
             self.save_data(force=True)
             logger.info(f"Added {stats['added']} questions. New total: {len(self.questions)}")
 
@@ -683,39 +1301,20 @@ class QuizManager:
     def delete_question(self, index: int):
         if 0 <= index < len(self.questions):
             self.questions.pop(index)
-            self.save_data()
+            self._rebuild_question_index()
+            self._mark_dirty('questions')
 
     def get_all_questions(self) -> List[Dict]:
-        """Get all questions with proper loading"""
-        try:
-            # Reload questions from file to ensure we have latest data
-            with open(self.questions_file, 'r') as f:
-                self.questions = json.load(f)
-            logger.info(f"Loaded {len(self.questions)} questions from file")
-            return self.questions
-        except Exception as e:
-            logger.error(f"Error loading questions: {e}")
-            return self.questions  # Return cached questions as fallback
-
-    def increment_score(self, user_id: int):
-        """Increment user's score and synchronize with statistics"""
-        user_id = str(user_id)
-        if user_id not in self.stats:
-            self._init_user_stats(user_id)
+        """Get all questions; the in-memory list is authoritative, use reload_data to re-read files"""
+        return self.questions
 
-        # Initialize score if needed
-        if user_id not in self.scores:
-            self.scores[user_id] = 0
+    def get_all_questions_json(self) -> bytes:
+        """Get all questions as compact JSON bytes, using orjson when available"""
+        return _dumps(self.questions, compact=True)
 
-        # Increment score and synchronize with stats
-        self.scores[user_id] += 1
-        stats = self.stats[user_id]
-        stats['correct_answers'] = self.scores[user_id]
-        stats['total_quizzes'] = max(stats['total_quizzes'] + 1, stats['correct_answers'])
-
-        # Record the attempt after synchronizing
+    def increment_score(self, user_id: int):
+        """Increment user's score; record_attempt keeps scores and stats in sync"""
         self.record_attempt(user_id, True)
-        self.save_data()
 
     def get_score(self, user_id: int) -> int:
         return self.scores.get(str(user_id), 0)
@@ -724,14 +1323,14 @@ class QuizManager:
         """Add a chat to active chats with proper initialization"""
         try:
             if chat_id not in self.active_chats:
-                self.active_chats.append(chat_id)
+                self.active_chats.add(chat_id)
                 # Initialize tracking structures for new chat
                 chat_id_str = str(chat_id)
                 self.recent_questions[chat_id_str] = deque(maxlen=50)
                 self.last_question_time[chat_id_str] = {}
-                self._initialize_available_questions(chat_id)
-                # Save changes immediately
-                self.save_data(force=True)
+                self._initialize_available_questions(chat_id_str)
+                # Persist in the background
+                self._mark_dirty('active_chats')
                 logger.info(f"Added chat {chat_id} to active chats with initialization")
         except Exception as e:
             logger.error(f"Error adding chat {chat_id}: {e}")
@@ -741,7 +1340,7 @@ class QuizManager:
         try:
             chat_id_str = str(chat_id)
             if chat_id in self.active_chats:
-                self.active_chats.remove(chat_id)
+                self.active_chats.discard(chat_id)
 
                 # Cleanup chat data
                 if chat_id_str in self.last_question_time:
@@ -751,108 +1350,35 @@ class QuizManager:
                 if chat_id_str in self.available_questions:
                     del self.available_questions[chat_id_str]
 
-                # Save changes immediately
-                self.save_data(force=True)
+                # Persist in the background
+                self._mark_dirty('active_chats')
                 logger.info(f"Removed chat {chat_id} from active chats with cleanup")
         except Exception as e:
             logger.error(f"Error removing chat {chat_id}: {e}")
 
     def get_active_chats(self) -> List[int]:
-        return self.active_chats
-
-    def cleanup_oldquestions(self) -> None:
-        """Clean up old questions history and inactive chats"""
-        try:
-            current_date= datetime.now().strftime('%Y-%m-%d')
-            week_ago = (datetime.now() - timedelta(days=7)).strftime('%Y-%m-%d')
-
-            # Clean up old questions from inactive chats
-            inactive_chats = []
-            for chat_id in self.active_chats:
-                chat_id_str = str(chat_id)
-                last_activity = self.get_group_last_activity(chat_id_str)
-
-                if not last_activity or last_activity < week_ago:
-                    inactive_chats.append(chat_id)
-
-                    # Clean up associated data
-                    if chat_id_str in self.recent_questions:
-                        del self.recent_questions[chat_id_str]
-                    if chat_id_str in self.last_question_time:
-                        del self.last_question_time[chat_id_str]
-                    if chat_id_str in self.available_questions:
-                        del self.available_questions[chat_id_str]
-
-            # Remove inactive chats
-            for chat_id in inactive_chats:
-                if chat_id in self.active_chats:
-                    self.active_chats.remove(chat_id)
-                    logger.info(f"Removed inactive chat: {chat_id}")
-
-            # Save changes
-            if inactive_chats:
-                self.save_data(force=True)
-                logger.info(f"Cleaned up {len(inactive_chats)} inactive chats")
-
-            # Clean up old daily activity data
-            for user_id, stats in self.stats.items():
-                try:
-                    # Clean daily activity
-                    old_dates = [
-                        date for date in stats['daily_activity']
-                        if date < week_ago
-                    ]
-                    for date in old_dates:
-                        del stats['daily_activity'][date]
-
-                    # Clean group activity
-                    for group_id, group_stats in stats.get('groups', {}).items():
-                        old_group_dates = [
-                            date for date in group_stats.get('daily_activity', {})
-                            if date < week_ago
-                        ]
-                        for date in old_group_dates:
-                            del group_stats['daily_activity'][date]
-
-                except Exception as e:
-                    logger.error(f"Error cleaning up stats for user {user_id}: {e}")
-                    continue
-
-            logger.info("Completed cleanup of old questions and inactive chats")
-
-        except Exception as e:
-            logger.error(f"Error in cleanup_old_questions: {e}")
+        return list(self.active_chats)
 
     def validate_question(self, question: Dict) -> bool:
         """Validate if a question's format and answer are correct"""
-        try:
-            # Basic structure validation
-            if not all(key in question for key in ['question', 'options', 'correct_answer']):
-                return False
-
-            # Validate options array
-            if not isinstance(question['options'], list) or len(question['options']) != 4:
-                return False
-
-            # Validate correct_answer is within bounds
-            if not isinstance(question['correct_answer'], int) or not (0 <= question['correct_answer'] < 4):
-                return False
-
-            return True
-        except Exception:
-            return False
+        return _is_valid_question(question)
 
     def remove_invalidquestions(self):
         """Remove questions with invalid format or answers"""
         try:
             initial_count = len(self.questions)
-            self.questions = [q for q in self.questions if self.validate_question(q)]
-            removed_count = initial_count - len(self.questions)
-
-            # Save changes immediately
-            self.save_data(force=True)
-
-            logger.info(f"Removed {removed_count} invalid questions. Remaining: {len(self.questions)}")
+            valid_questions = list(filter(_is_valid_question, self.questions))
+            removed_count = initial_count - len(valid_questions)
+
+            # Save changes immediately, skipping the rewrite when nothing was removed
+            if removed_count:
+                self.questions = valid_questions
+                self._rebuild_question_index()
+                self._mark_dirty('questions')
+                self.save_data(force=True)
+                logger.info(f"Removed {removed_count} invalid questions. Remaining: {len(self.questions)}")
+            else:
+                logger.debug("No invalid questions found among %d", initial_count)
             return {
                 'initial_count': initial_count,
                 'removed_count': removed_count,
@@ -865,7 +1391,13 @@ class QuizManager:
     def clear_all_questions(self) -> bool:
         """Clear all questions from the database"""
         try:
+            if not self.questions:
+                logger.debug("No questions to clear")
+                return True
+
             self.questions = []
+            self._question_text_set.clear()
+            self._mark_dirty('questions')
             self.save_data(force=True)
             logger.info("All questions cleared successfully")
             return True
@@ -886,7 +1418,9 @@ class QuizManager:
             # Reset caches and tracking structures
             self._cached_questions = None
             self._cached_leaderboard = None
-            self._leaderboard_cache_time = None
+            self._leaderboard_dirty = True
+            self._group_leaderboard_cache.clear()
+            self._global_stats_cache = None
             self.recent_questions.clear()
             self.last_question_time.clear()
             self.available_questions.clear()
@@ -897,22 +1431,21 @@ class QuizManager:
             # Merge states
             self.stats.update(current_stats)
             self.scores.update(current_scores)
+            self._rebuild_group_index()
+            self._rebuild_rankings()
+            self._rebuild_aggregates()
 
-            # Collect all active chats from both direct tracking and user stats
-            all_active_chats = set(current_active_chats)
+            # Merge the reloaded active chats with those tracked before the reload, in place
+            all_active_chats = self.active_chats
+            all_active_chats.update(current_active_chats)
 
-            # Add chats from group activity in user stats
-            for user_stats in self.stats.values():
-                # Add all group chats from user stats
-                all_active_chats.update(
-                    int(chat_id) for chat_id in user_stats.get('groups', {}).keys()
-                )
-                # Add private chats (where user_id matches chat_id)
-                if user_stats.get('last_quiz_date'):
-                    all_active_chats.add(int(list(user_stats.keys())[0]))
+            # Add group chats known from user stats
+            all_active_chats.update(int(chat_id) for chat_id in self._group_index)
 
-            # Update active_chats with merged unique chats
-            self.active_chats = sorted(all_active_chats)
+            # Add private chats (where user_id matches chat_id)
+            all_active_chats.update(
+                int(user_id) for user_id, user_stats in self.stats.items() if user_stats.get('last_quiz_date')
+            )
 
             # Force save to ensure clean state
             self.save_data(force=True)
@@ -931,28 +1464,29 @@ class QuizManager:
 
     def get_group_last_activity(self, chat_id: str) -> Optional[str]:
         """Get the last activity date for a group"""
-        try:
-            latest_activity = None
-            chat_id_str = str(chat_id)
+        return self._group_last_active.get(str(chat_id))
 
-            # Check all users' group activity
-            for stats in self.stats.values():
-                if chat_id_str in stats.get('groups', {}):
-                    group_last_activity = stats['groups'][chat_id_str].get('last_activity_date')
-                    if group_last_activity:
-                        if not latest_activity or group_last_activity > latest_activity:
-                            latest_activity = group_last_activity
+    def get_group_last_activities(self, chat_ids) -> Dict[str, Optional[str]]:
+        """Get the last activity date for each of the given groups in one call"""
+        last_active_of = self._group_last_active.get
+        return {chat_id_str: last_active_of(chat_id_str) for chat_id_str in map(str, chat_ids)}
 
-            return latest_activity
-        except Exception as e:
-            logger.error(f"Error getting group last activity: {e}")
-            return None
+    def get_stats_version(self) -> int:
+        """Return a counter that changes whenever data is modified, for callers caching derived results"""
+        return self._mutation_seq
 
     def get_global_statistics(self) -> Dict:
         """Get comprehensive global statistics with accurate user counting"""
         try:
-            current_date = datetime.now().strftime('%Y-%m-%d')
-            week_start = (datetime.now() - timedelta(days=7)).strftime('%Y-%m-%d')
+            now = datetime.now()
+
+            # Reuse the last result while nothing has changed and it is recent
+            cached = self._global_stats_cache
+            if cached and cached[1] == self._mutation_seq and now - cached[0] < self._global_stats_ttl:
+                return cached[2]
+
+            calendar = self._calendar()
+            current_date = calendar.today
 
             # Initialize stats structure
             stats = {
@@ -960,13 +1494,18 @@ class QuizManager:
                     'total': 0,
                     'active_today': 0,
                     'active_week': 0,
+                    'active_month': 0,
+                    'new_today': 0,
                     'private_chat': 0,
                     'group_users': 0
                 },
                 'groups': {
                     'total': len(self.active_chats),
                     'active_today': 0,
-                    'active_week': 0
+                    'active_week': 0,
+                    'active_month': 0,
+                    'active': 0,
+                    'inactive': 0
                 },
                 'quizzes': {
                     'total_attempts': 0,
@@ -974,103 +1513,113 @@ class QuizManager:
                     'today_attempts': 0,
                     'week_attempts': 0
                 },
+                'today': {
+                    'quizzes': 0,
+                    'users': 0,
+                    'success_rate': 0
+                },
                 'performance': {
                     'success_rate': 0,
+                    'total_quizzes': 0,
+                    'correct_answers': 0,
                     'questions_available': len(self.questions)
                 }
             }
 
-            # Get all group members
+            # Collect group members and group activity in a single pass over the active chats
             group_users = set()
-            private_users = set()
-            for chat_id in self.active_chats:
-                members = self.get_group_members(str(chat_id))
-                group_users.update(members)
-
-            # Process user statistics
-            for user_id, user_stats in self.stats.items():
-                # Track private chat users
-                if 'private_chat_activity' in user_stats and user_stats['private_chat_activity'].get('total_messages', 0) > 0:
-                    private_users.add(user_id)
-                    stats['users']['private_chat'] += 1
-
-                # Track activity periods
-                last_active = user_stats.get('last_activity_date')
-                if last_active:
-                    if last_active == current_date:
-                        stats['users']['active_today'] += 1
-                    if last_active >= week_start:
-                        stats['users']['active_week'] += 1
-
-                # Track quiz performance
-                stats['quizzes']['total_attempts'] += user_stats.get('total_quizzes', 0)
-                stats['quizzes']['correct_answers'] += user_stats.get('correct_answers', 0)
-
-                # Track today's attempts
-                today_activity = user_stats.get('daily_activity', {}).get(current_date, {})
-                stats['quizzes']['today_attempts'] += today_activity.get('attempts', 0)
-
-                # Track week's attempts
-                stats['quizzes']['week_attempts'] += sum(
-                    day_stats.get('attempts', 0)
-                    for date, day_stats in user_stats.get('daily_activity', {}).items()
-                    if date >= week_start
-                )
-
-            # Update group activity
-            for chat_id in self.active_chats:
-                chat_id_str = str(chat_id)
-                last_activity = self.get_group_last_activity(chat_id_str)
+            private_users = self._private_users
+            members_of = self._group_index.get
+            group_counts = stats['groups']
+            for chat_id_str, last_activity in self.get_group_last_activities(self.active_chats).items():
+                group_users.update(members_of(chat_id_str, ()))
                 if last_activity:
                     if last_activity == current_date:
-                        stats['groups']['active_today'] += 1
-                    if last_activity >= week_start:
-                        stats['groups']['active_week'] += 1
+                        group_counts['active_today'] += 1
+                    if last_activity >= calendar.week_ago:
+                        group_counts['active_week'] += 1
+                    if last_activity >= calendar.month_start:
+                        group_counts['active_month'] += 1
+            stats['users']['private_chat'] = len(private_users)
+
+            # Groups count as active when used within the last week
+            group_counts['active'] = group_counts['active_week']
+            group_counts['inactive'] = group_counts['total'] - group_counts['active_week']
+
+            # Activity periods come from the per-day counts of users' last activity
+            stats['users']['active_today'] = self._last_active_counts.get(current_date, 0)
+            stats['users']['active_week'] = sum(
+                count for date, count in self._last_active_counts.items() if date >= calendar.week_ago
+            )
+            stats['users']['active_month'] = sum(
+                count for date, count in self._last_active_counts.items() if date >= calendar.month_start
+            )
+            stats['users']['new_today'] = self._daily_joins.get(current_date, 0)
+
+            # Quiz figures come from the running totals kept by record_attempt
+            stats['quizzes']['total_attempts'] = self._totals['total_attempts']
+            stats['quizzes']['correct_answers'] = self._totals['correct_answers']
+            stats['quizzes']['today_attempts'] = self._daily_attempts.get(current_date, 0)
+            stats['quizzes']['week_attempts'] = sum(
+                attempts for date, attempts in self._daily_attempts.items() if date >= calendar.week_ago
+            )
 
             # Calculate final user counts
             all_users = group_users.union(private_users)
             stats['users']['total'] = len(all_users)
             stats['users']['group_users'] = len(group_users)
 
-            # Calculate success rate
+            # Calculate success rates
+            stats['performance']['total_quizzes'] = stats['quizzes']['total_attempts']
+            stats['performance']['correct_answers'] = stats['quizzes']['correct_answers']
             if stats['quizzes']['total_attempts'] > 0:
                 stats['performance']['success_rate'] = round(
                     (stats['quizzes']['correct_answers'] / stats['quizzes']['total_attempts']) * 100, 1
                 )
 
+            # Summarize today's activity
+            today_attempts = stats['quizzes']['today_attempts']
+            stats['today']['quizzes'] = today_attempts
+            stats['today']['users'] = stats['users']['active_today']
+            if today_attempts > 0:
+                stats['today']['success_rate'] = round(
+                    self._daily_correct.get(current_date, 0) / today_attempts * 100, 1
+                )
+
+            self._global_stats_cache = (now, self._mutation_seq, stats)
             logger.info(f"Global stats generated: {stats}")
             return stats
 
         except Exception as e:
             logger.error(f"Error getting global statistics: {e}\n{traceback.format_exc()}")
             return {
-                'users': {'total': 0, 'active_today': 0, 'active_week': 0, 'private_chat': 0, 'group_users': 0},
-                'groups': {'total': 0, 'active_today': 0, 'active_week': 0},
+                'users': {'total': 0, 'active_today': 0, 'active_week': 0, 'active_month': 0, 'new_today': 0,
+                          'private_chat': 0, 'group_users': 0},
+                'groups': {'total': 0, 'active_today': 0, 'active_week': 0, 'active_month': 0,
+                           'active': 0, 'inactive': 0},
                 'quizzes': {'total_attempts': 0, 'correct_answers': 0, 'today_attempts': 0, 'week_attempts': 0},
-                'performance': {'success_rate': 0, 'questions_available': 0}
+                'today': {'quizzes': 0, 'users': 0, 'success_rate': 0},
+                'performance': {'success_rate': 0, 'total_quizzes': 0, 'correct_answers': 0,
+                                'questions_available': 0}
             }
 
     def get_group_members(self, chat_id: str) -> set:
         """Get all members who have participated in a group"""
-        members = set()
-        for user_id, stats in self.stats.items():
-            if 'groups' in stats and chat_id in stats['groups']:
-                members.add(user_id)
-        return members
+        return set(self._group_index.get(str(chat_id), ()))
 
     def track_user_activity(self, user_id: int, chat_id: int) -> None:
         """Track user activity in real-time"""
         try:
             user_id_str = str(user_id)
             chat_id_str = str(chat_id)
-            current_date = datetime.now().strftime('%Y-%m-%d')
+            current_date = self._calendar().today
 
             # Initialize user if not exists
             if user_id_str not in self.stats:
                 self._init_user_stats(user_id_str)
 
             # Update user's last activity
-            self.stats[user_id_str]['last_activity_date'] = current_date
+            self._set_last_activity(self.stats[user_id_str], current_date)
 
             # Update group activity if it's a group chat
             if chat_id_str not in self.stats[user_id_str].get('groups', {}):
@@ -1084,10 +1633,13 @@ class QuizManager:
                     'longest_streak': 0,
                     'last_correct_date': None
                 }
+                self._note_group_activity(chat_id_str, current_date)
+            self._group_index[chat_id_str].add(user_id_str)
+            self._update_rankings(user_id_str, chat_id_str)
 
-            # Force save to ensure no data loss
-            self.save_data(force=True)
-            logger.info(f"Tracked activity for user {user_id} in chat {chat_id}")
+            # Persist in the background
+            self._mark_stats_dirty(user_id_str)
+            logger.debug("Tracked activity for user %s in chat %s", user_id, chat_id)
 
         except Exception as e:
             logger.error(f"Error tracking user activity: {e}")
@@ -1095,8 +1647,7 @@ class QuizManager:
     def get_active_users(self) -> List[str]:
         """Get list of active users with improved tracking"""
         try:
-            current_date = datetime.now().strftime('%Y-%m-%d')
-            week_start = (datetime.now() - timedelta(days=7)).strftime('%Y-%m-%d')
+            week_ago = self._calendar().week_ago
 
             active_users = set()
 
@@ -1104,19 +1655,19 @@ class QuizManager:
             for user_id, stats in self.stats.items():
                 # Check last activity date
                 last_activity = stats.get('last_activity_date')
-                if last_activity and last_activity >= week_start:
+                if last_activity and last_activity >= week_ago:
                     active_users.add(user_id)
                     continue
 
                 # Check private chat activity
                 private_chat = stats.get('private_chat_activity', {})
-                if private_chat.get('last_active', '') >= week_start:
+                if private_chat.get('last_active', '') >= week_ago:
                     active_users.add(user_id)
                     continue
 
                 # Check group activity
                 for group_stats in stats.get('groups', {}).values():
-                    if group_stats.get('last_activity_date', '') >= week_start:
+                    if group_stats.get('last_activity_date', '') >= week_ago:
                         active_users.add(user_id)
                         break
 
@@ -1128,8 +1679,13 @@ class QuizManager:
     def update_all_stats(self) -> None:
         """Update all statistics in real-time with enhanced tracking"""
         try:
-            current_date = datetime.now().strftime('%Y-%m-%d')
-            week_start = (datetime.now() - timedelta(days=7)).strftime('%Y-%m-%d')
+            calendar = self._calendar()
+            current_date = calendar.today
+
+            # Nothing to do if no data changed since the last run on the same day
+            if self._all_stats_updated == (current_date, self._mutation_seq):
+                logger.debug("Skipping stats update, nothing changed since the last run")
+                return
 
             # Update user stats
             for user_id, stats in self.stats.items():
@@ -1137,49 +1693,45 @@ class QuizManager:
                     # Ensure required fields exist
                     if 'join_date' not in stats:
                         stats['join_date'] = current_date
+                        self._count_day(self._daily_joins, current_date)
                     if 'last_activity_date' not in stats:
-                        stats['last_activity_date'] = current_date
+                        self._set_last_activity(stats, current_date)
                     if 'private_chat_activity' not in stats:
                         stats['private_chat_activity'] = {
                             'total_messages': 0,
                             'last_active': current_date
                         }
 
-                    # Ensure daily activity exists
+                    # Ensure daily activity exists, trimming old days when a new one starts
                     if current_date not in stats['daily_activity']:
+                        _trim_daily_activity(stats['daily_activity'], calendar.cutoff)
                         stats['daily_activity'][current_date] = {
                             'attempts': 0,
                             'correct': 0
                         }
 
-                    # Update group stats
+                    # Update group stats the same way; the window covers the group's monthly figures
                     for group_id, group_stats in stats.get('groups', {}).items():
                         if current_date not in group_stats.get('daily_activity', {}):
+                            _trim_daily_activity(group_stats['daily_activity'], calendar.cutoff)
                             group_stats['daily_activity'][current_date] = {
                                 'attempts': 0,
                                 'correct': 0
                             }
 
-                        # Clean up old daily activity data
-                        old_dates = [
-                            date for date in group_stats['daily_activity']
-                            if date < week_start
-                        ]
-                        for date in old_dates:
-                            del group_stats['daily_activity'][date]
-
                     # Sync with scores
                     score = self.scores.get(user_id, 0)
                     if score != stats['correct_answers']:
-                        stats['correct_answers'] = score
-                        stats['total_quizzes'] = max(stats['total_quizzes'], score)
+                        self._sync_score(user_id, stats, score)
+                        self._user_stats_cache.pop(user_id, None)
 
                 except Exception as e:
                     logger.error(f"Error updating stats for user {user_id}: {e}")
                     continue
 
-            # Force save after updates
-            self.save_data(force=True)
+            # Persist in the background
+            self._mark_dirty('stats')
+            self._all_stats_updated = (current_date, self._mutation_seq)
             logger.info("All stats updated successfully")
 
         except Exception as e:
@@ -1190,25 +1742,28 @@ class QuizManager:
         try:
             current_time = datetime.now()
             cutoff_time = current_time - timedelta(hours=24)
+            recent_questions = self.recent_questions
+            last_question_time = self.last_question_time
+            available_questions = self.available_questions
 
-            for chat_id in list(self.recent_questions.keys()):
+            for chat_id in list(recent_questions.keys()):
                 # Clear tracking for inactive chats
-                if not self.recent_questions[chat_id]:
-                    del self.recent_questions[chat_id]
-                    if chat_id in self.last_question_time:
-                        del self.last_question_time[chat_id]
-                    if chat_id in self.available_questions:
-                        del self.available_questions[chat_id]
+                if not recent_questions[chat_id]:
+                    del recent_questions[chat_id]
+                    last_question_time.pop(chat_id, None)
+                    available_questions.pop(chat_id, None)
                     continue
 
-                # Remove old question timestamps
-                if chat_id in self.last_question_time:
-                    old_questions = [
-                        q for q, t in self.last_question_time[chat_id].items()
-                        if t < cutoff_time
-                    ]
+                # Remove old question timestamps; entries are in time order, so stop at the first fresh one
+                question_times = last_question_time.get(chat_id)
+                if question_times:
+                    old_questions = []
+                    for q, t in question_times.items():
+                        if t >= cutoff_time:
+                            break
+                        old_questions.append(q)
                     for q in old_questions:
-                        del self.last_question_time[chat_id][q]
+                        del question_times[q]
 
             logger.info("Completed cleanup of old questions history")
         except Exception as e:
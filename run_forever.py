@@ -48,8 +48,8 @@ def run_bot_forever():
 
             # If the bot has been restarting too frequently, implement exponential backoff
             if last_start_time and (current_time - last_start_time).seconds < 60:
-                restart_count += 1
-                wait_time = min(30 * (2 ** restart_count), 300)  # Max 5 minutes wait
+                restart_count = min(restart_count + 1, 4)  # 30 << 4 already exceeds the cap
+                wait_time = min(30 << restart_count, 300)  # Max 5 minutes wait
                 logger.warning(f"Bot restarting too frequently. Waiting {wait_time} seconds...")
                 time.sleep(wait_time)
             else:
@@ -58,32 +58,30 @@ def run_bot_forever():
             last_start_time = current_time
             logger.info("Starting bot process...")
 
-            # Start the main bot process
-            process = subprocess.Popen(
-                [sys.executable, 'main.py'],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                universal_newlines=True
-            )
-
-            # Monitor the process
-            while process.poll() is None:
-                # Check memory usage
-                memory_usage = check_process_memory(process.pid)
-                if memory_usage > memory_threshold:
-                    logger.warning(f"Memory usage too high ({memory_usage}MB). Restarting...")
-                    process.terminate()
+            # Start the main bot process, sending its output straight to the log file
+            with open('bot.log', 'ab', buffering=0) as bot_log:
+                process = subprocess.Popen(
+                    [sys.executable, 'main.py'],
+                    stdout=bot_log,
+                    stderr=subprocess.STDOUT
+                )
+
+            # Monitor the process, waking periodically to check memory usage
+            while True:
+                try:
+                    process.wait(timeout=10)
                     break
-
-                # Read output for logging
-                stdout = process.stdout.readline()
-                if stdout:
-                    logger.info(stdout.strip())
-                stderr = process.stderr.readline()
-                if stderr:
-                    logger.error(stderr.strip())
-
-                time.sleep(1)
+                except subprocess.TimeoutExpired:
+                    memory_usage = check_process_memory(process.pid)
+                    if memory_usage > memory_threshold:
+                        logger.warning(f"Memory usage too high ({memory_usage}MB). Restarting...")
+                        process.terminate()
+                        try:
+                            process.wait(timeout=30)
+                        except subprocess.TimeoutExpired:
+                            process.kill()
+                            process.wait()
+                        break
 
             # If the process exited
             if process.returncode is not None:
@@ -0,0 +1,47 @@
+import atexit
+import os
+
+import pytest
+
+from quiz_manager import QuizManager
+
+
+@pytest.fixture
+def make_manager(tmp_path, monkeypatch):
+    """Create QuizManagers working in an empty data directory, saving only when told to"""
+    monkeypatch.chdir(tmp_path)
+    managers = []
+
+    def make():
+        manager = QuizManager()
+        manager._save_delay = 3600  # Keep the background worker out of the way
+        managers.append(manager)
+        return manager
+
+    yield make
+    for manager in managers:
+        atexit.unregister(manager._final_flush)
+        manager._close_stats_journal()
+
+
+def test_crash_after_compaction_snapshot_keeps_newer_values(make_manager):
+    manager = make_manager()
+
+    # First attempt only reaches the journal
+    manager.record_attempt(1, True)
+    manager.save_data(force=True)
+    assert os.path.getsize(manager.stats_journal_file) > 0
+
+    # Second attempt and a bulk stats change go out through a compaction that dies before cleanup
+    manager.record_attempt(1, True)
+    manager.stats['1']['category_scores'] = {'history': 5}
+    manager._mark_dirty('stats')
+    manager._discard_retired_journal = lambda: None
+    manager.save_data(force=True)
+    assert os.path.exists(manager.retired_journal_file)
+
+    reloaded = make_manager()
+    assert reloaded.scores['1'] == 2
+    assert reloaded.stats['1']['correct_answers'] == 2
+    assert reloaded.stats['1']['category_scores'] == {'history': 5}
+    assert not os.path.exists(reloaded.retired_journal_file)